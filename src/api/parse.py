@@ -22,10 +22,17 @@ async def parse_pdf(
     tolerance: Optional[int] = Form(None),
     pdf_parse_service=Depends(Provide[Container.pdf_parse_service]),
 ):
-    parse_config = ParseConfig(
-        footer_margin=footer_margin,
-        header_margin=header_margin,
-        no_image_text=no_image_text,
-        tolerance=tolerance,
-    )
+    # Form values are already validated by FastAPI, so only build a config
+    # when the request overrides at least one default
+    parse_config = None
+    if any(
+        option is not None
+        for option in (footer_margin, header_margin, no_image_text, tolerance)
+    ):
+        parse_config = ParseConfig(
+            footer_margin=footer_margin,
+            header_margin=header_margin,
+            no_image_text=no_image_text,
+            tolerance=tolerance,
+        )
     return await pdf_parse_service.parse(file, parse_config)
@@ -12,7 +12,7 @@ class Container(containers.DeclarativeContainer):
 
     parser_settings_path = Path("src/config/parser_settings.yaml")
     with open(parser_settings_path, "r") as f:
-        parser_settings = yaml.safe_load(f)
+        parser_settings = yaml.safe_load(f)["parser_settings"]
 
     pdf_parse_service = providers.Singleton(
         PDFParseService,
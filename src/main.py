@@ -1,5 +1,8 @@
 # app/main.py
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from uvicorn import Config, Server
 
 from src.api.health_router import health_router
@@ -8,10 +11,23 @@ from src.config.config import ServerSettings
 from src.config.injection import Container
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the parse service once at startup; its worker pool is started on
+    # first use and shared by all requests, then stopped here on shutdown.
+    pdf_parse_service = app.container.pdf_parse_service()
+    yield
+    pdf_parse_service.shutdown()
+
+
 def create_app() -> FastAPI:
     container = Container()
 
-    app = FastAPI(title="PyMuPDF Extraction Service")
+    app = FastAPI(
+        title="PyMuPDF Extraction Service",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
 
     app.container = container
 
@@ -1,17 +1,20 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
 from typing import Optional
 
 
-class ParseConfig(BaseModel):
-    footer_margin: Optional[int] = Field(
-        None, description="Margin from the bottom of the page to ignore as footer."
-    )
-    header_margin: Optional[int] = Field(
-        None, description="Margin from the top of the page to ignore as header."
-    )
-    no_image_text: Optional[bool] = Field(
-        None, description="Whether to exclude text overlaid on images."
-    )
-    tolerance: Optional[int] = Field(
-        None, description="Tolerance for merging table bounding boxes."
-    )
+@dataclass(slots=True, frozen=True)
+class ParseConfig:
+    """
+    Per-request parsing options; fields left as None fall back to service defaults.
+
+    Attributes:
+        footer_margin: Margin from the bottom of the page to ignore as footer.
+        header_margin: Margin from the top of the page to ignore as header.
+        no_image_text: Whether to exclude text overlaid on images.
+        tolerance: Tolerance for merging table bounding boxes.
+    """
+
+    footer_margin: Optional[int] = None
+    header_margin: Optional[int] = None
+    no_image_text: Optional[bool] = None
+    tolerance: Optional[int] = None
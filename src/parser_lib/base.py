@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
 from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Union
 
 
 class BaseParser(ABC):
     @abstractmethod
-    async def parse(self, file: bytes, executor: ProcessPoolExecutor) -> bytes:
+    async def parse(
+        self, file: Union[bytes, str], executor: Optional[ProcessPoolExecutor] = None
+    ) -> bytes:
         raise NotImplementedError
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
@@ -28,17 +29,10 @@ class CategoryEnum(str, Enum):
         return str(self.value)
 
 
+@dataclass(slots=True)
 class Element:
-    def __init__(
-        self,
-        text: str,
-        category: Optional[CategoryEnum] = None,
-        start_page: Optional[int] = 1,
-        end_page: Optional[int] = 1,
-        b64: Optional[str] = None,
-    ):
-        self.text = text
-        self.category = category
-        self.start_page = start_page
-        self.end_page = end_page
-        self.b64 = b64
+    text: str
+    category: Optional[CategoryEnum] = None
+    start_page: Optional[int] = 1
+    end_page: Optional[int] = 1
+    b64: Optional[str] = None
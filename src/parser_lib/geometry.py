@@ -0,0 +1,155 @@
+from typing import NamedTuple
+
+import numpy as np
+
+
+class BBox(NamedTuple):
+    """
+    Lightweight rectangle with the coordinate attributes of ``fitz.Rect``.
+
+    Every helper here, and the parser's table geometry, only reads x0, y0, x1
+    and y1, so a BBox can stand in for a fitz rectangle.
+    """
+
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+
+
+def bbox_array(bboxes) -> np.ndarray:
+    """
+    Stack rect-like objects into a single array of coordinates.
+
+    Args:
+        bboxes (Iterable): Objects exposing x0, y0, x1 and y1 attributes.
+
+    Returns:
+        np.ndarray: Array of shape (N, 4) holding x0, y0, x1, y1 per row.
+    """
+    coords = [(b.x0, b.y0, b.x1, b.y1) for b in bboxes]
+    return np.array(coords, dtype=np.float64).reshape(-1, 4)
+
+
+def intersection_mask(bboxes1: np.ndarray, bboxes2: np.ndarray) -> np.ndarray:
+    """
+    Compute which pairs of bounding boxes have a non-empty intersection.
+
+    Matches ``not (a & b).is_empty`` for fitz rectangles.
+
+    Args:
+        bboxes1 (np.ndarray): Array of shape (N, 4).
+        bboxes2 (np.ndarray): Array of shape (M, 4).
+
+    Returns:
+        np.ndarray: Boolean mask of shape (N, M).
+    """
+    x0 = np.maximum(bboxes1[:, None, 0], bboxes2[None, :, 0])
+    y0 = np.maximum(bboxes1[:, None, 1], bboxes2[None, :, 1])
+    x1 = np.minimum(bboxes1[:, None, 2], bboxes2[None, :, 2])
+    y1 = np.minimum(bboxes1[:, None, 3], bboxes2[None, :, 3])
+    return (x0 < x1) & (y0 < y1)
+
+
+def merge_mask(bboxes: np.ndarray, tolerance: int) -> np.ndarray:
+    """
+    Compute which consecutive pairs of table bounding boxes should be merged.
+
+    Vectorised form of ``PymupdfParser.should_merge_tables`` applied to each
+    box and the one after it: two boxes merge when they are aligned
+    horizontally or vertically and lie close together.
+
+    Args:
+        bboxes (np.ndarray): Array of shape (N, 4).
+        tolerance (int): Maximum misalignment and distance, in points.
+
+    Returns:
+        np.ndarray: Boolean mask of shape (N - 1,); entry i is True when box i
+                    and box i + 1 should be merged.
+    """
+    # Differences of integer coordinates can overflow, so compare as float64;
+    # bbox_array's output is float64 already and is used as is
+    bboxes = bboxes.astype(np.float64, copy=False)
+    a, b = bboxes[:-1], bboxes[1:]
+    ax0, ay0, ax1, ay1 = (a[:, i] for i in range(4))
+    bx0, by0, bx1, by1 = (b[:, i] for i in range(4))
+
+    horizontally_aligned = (np.abs(ay0 - by0) < tolerance) & (
+        np.abs(ay1 - by1) < tolerance
+    )
+    vertically_aligned = (np.abs(ax0 - bx0) < tolerance) & (
+        np.abs(ax1 - bx1) < tolerance
+    )
+
+    horizontal_distance = np.minimum(np.abs(ax1 - bx0), np.abs(bx1 - ax0))
+    vertical_distance = np.minimum(np.abs(ay1 - by0), np.abs(by1 - ay0))
+
+    is_close = (horizontal_distance < tolerance) | (vertical_distance < tolerance)
+
+    return (horizontally_aligned | vertically_aligned) & is_close
+
+
+class BBoxIndex:
+    """
+    Bounding boxes sorted by (y0, x0) for containment and intersection lookups.
+
+    A box can only contain or intersect a query box if its top edge lies above
+    the query's, so a binary search on y0 bounds the boxes that need checking.
+    The remaining candidates are tested in one vectorised comparison.
+    """
+
+    def __init__(self, bboxes):
+        self.bboxes = sorted(bboxes, key=lambda b: (b.y0, b.x0))
+        self._coords = bbox_array(self.bboxes)
+        self._containing = {}
+
+    def __len__(self) -> int:
+        return len(self.bboxes)
+
+    def first_containing(self, bbox) -> int:
+        """
+        Find the first box (in sorted order) that contains the given box.
+
+        Results are cached, as the same block is looked up several times.
+
+        Args:
+            bbox (fitz.IRect): Box to look up.
+
+        Returns:
+            int: 1-based position of the containing box, or 0 if there is none.
+        """
+        key = (bbox.x0, bbox.y0, bbox.x1, bbox.y1)
+        position = self._containing.get(key)
+        if position is None:
+            position = self._first_containing(*key)
+            self._containing[key] = position
+        return position
+
+    def _first_containing(self, x0, y0, x1, y1) -> int:
+        if x0 > x1 or y0 > y1:
+            return 0
+        end = np.searchsorted(self._coords[:, 1], y0, side="right")
+        candidates = self._coords[:end]
+        contains = (
+            (candidates[:, 0] <= x0)
+            & (candidates[:, 2] >= x1)
+            & (candidates[:, 1] <= y0)
+            & (candidates[:, 3] >= y1)
+        )
+        if not contains.any():
+            return 0
+        return int(np.argmax(contains)) + 1
+
+    def intersects(self, bbox) -> bool:
+        """
+        Check whether any box has a non-empty intersection with the given box.
+
+        Args:
+            bbox (fitz.IRect): Box to look up.
+
+        Returns:
+            bool: True if at least one box intersects it.
+        """
+        end = np.searchsorted(self._coords[:, 1], bbox.y1, side="left")
+        query = np.array([(bbox.x0, bbox.y0, bbox.x1, bbox.y1)], dtype=np.float64)
+        return bool(intersection_mask(query, self._coords[:end]).any())
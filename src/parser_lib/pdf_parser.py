@@ -1,17 +1,59 @@
 import asyncio
 import fitz
-from concurrent.futures import ProcessPoolExecutor
+import functools
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import os
 import logging
-from typing import Tuple, List, Optional
+import tempfile
+from typing import NamedTuple, Tuple, List, Optional, Union
 
 from src.models.data_schemas import ParseConfig
 from src.parser_lib.base import BaseParser
 from src.parser_lib.categories import Element
+from src.parser_lib.geometry import (
+    BBoxIndex,
+    bbox_array,
+    intersection_mask,
+    merge_mask,
+)
 
 # Set environment variable to disable tokenizers parallelism
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
 
+# Each worker gets at least this many pages, so shorter documents go to a single
+# worker as one chunk, where splitting them would cost more than it saves.
+MIN_PAGES_PER_WORKER = 4
+
+# Regions left above or below a table that are shorter than this, in points,
+# can't hold a line of text, so they are dropped without extracting them.
+MIN_SPLIT_HEIGHT = 5
+
+
+class PageResult(NamedTuple):
+    """Extracted content of one page, as parallel lists of texts and categories."""
+
+    page_num: int
+    texts: List[str]
+    categories: List[str]
+
+
+@functools.lru_cache(maxsize=128)
+def _page_segments(num_pages: int, num_workers: int) -> Tuple[Tuple[int, int], ...]:
+    # Never more segments than pages, but always at least one so an empty
+    # document still yields [(0, 0)]
+    num_workers = max(1, min(num_workers, num_pages))
+    chunk_size, remainder = divmod(num_pages, num_workers)
+
+    # The first `remainder` segments take one extra page each
+    return tuple(
+        (
+            i * chunk_size + min(i, remainder),
+            (i + 1) * chunk_size + min(i + 1, remainder),
+        )
+        for i in range(num_workers)
+    )
+
 
 class PymupdfParser(BaseParser):
     """
@@ -23,6 +65,14 @@ class PymupdfParser(BaseParser):
         header_margin (int): Margin from the top of the page to ignore as header.
         no_image_text (bool): Whether to exclude text overlaid on images.
         tolerance (int): Tolerance for merging table bounding boxes.
+        wrap_contents (bool): Whether to wrap each page's content stream in q/Q
+                              before extraction.
+        spool_dir (Optional[str]): Directory for the temporary file that byte
+                                   input is written to, so workers can open it
+                                   by path. Defaults to the system temp directory.
+
+    The parser owns a process pool, started on the first document large enough
+    to need it and reused afterwards; call close() to stop it.
     """
 
     def __init__(
@@ -32,26 +82,73 @@ class PymupdfParser(BaseParser):
         header_margin: int,
         no_image_text: bool,
         tolerance: int,
+        wrap_contents: bool = False,
+        spool_dir: Optional[str] = None,
     ):
         super().__init__()
+        if max_processors <= 0:
+            raise ValueError("Number of processors must be greater than 0")
+
         self.max_processors = max_processors
         self.footer_margin = footer_margin
         self.header_margin = header_margin
         self.no_image_text = no_image_text
         self.tolerance = tolerance
+        self.wrap_contents = wrap_contents
+        self.spool_dir = spool_dir
+        self._executor = None
+        self._local_executor = None
+
+    def __getstate__(self):
+        # The parser is sent to workers with each chunk; the pools stay behind
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        state["_local_executor"] = None
+        return state
+
+    def get_executor(self) -> ProcessPoolExecutor:
+        """
+        Return the parser's process pool, starting it on first use.
+
+        Returns:
+            ProcessPoolExecutor: Pool with max_processors workers.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_processors)
+        return self._executor
+
+    def _get_local_executor(self) -> ThreadPoolExecutor:
+        # PyMuPDF is not thread-safe (find_tables even keeps module-level state),
+        # so the page counts taken in this process run on one thread, off the
+        # event loop
+        if self._local_executor is None:
+            self._local_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="pymupdf"
+            )
+        return self._local_executor
+
+    def close(self):
+        """Stop the parser's process pool and local thread, if they were started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        if self._local_executor is not None:
+            self._local_executor.shutdown(wait=True, cancel_futures=True)
+            self._local_executor = None
 
     async def parse(
         self,
-        file: bytes,
-        executor: ProcessPoolExecutor,
+        file: Union[bytes, str],
+        executor: Optional[ProcessPoolExecutor] = None,
         parse_config: Optional[ParseConfig] = None,
     ) -> Tuple[List[Element], int]:
         """
         Parse a PDF file and extract elements such as text and tables.
 
         Args:
-            file (bytes): Byte content of the PDF file to parse.
-            executor: Process executor
+            file (Union[bytes, str]): Byte content of the PDF file to parse, or the
+                                      path of a PDF file already on disk.
+            executor: Process executor. Defaults to the parser's own pool.
             parse_config: Object containing parsing options.
 
         Returns:
@@ -80,12 +177,42 @@ class PymupdfParser(BaseParser):
             else self.tolerance
         )
 
+        spooled_path = None
         try:
-            # Open the document directly from memory
-            doc = fitz.open(stream=file, filetype="pdf")
-            num_pages = len(doc)
+            if isinstance(file, (bytes, bytearray)):
+                # Write the document once; workers open it by path
+                with tempfile.NamedTemporaryFile(
+                    suffix=".pdf", dir=self.spool_dir, delete=False
+                ) as tmp:
+                    spooled_path = tmp.name
+                    tmp.write(file)
+                file_path = spooled_path
+            else:
+                file_path = file
 
-            page_segments = self.get_page_segments(num_pages)
+            def to_elements(results):
+                return [
+                    Element(text, category, result.page_num + 1, result.page_num + 1)
+                    for result in results
+                    for text, category in zip(result.texts, result.categories)
+                ]
+
+            loop = asyncio.get_running_loop()
+            num_pages = await loop.run_in_executor(
+                self._get_local_executor(), self._count_pages, file_path
+            )
+            if num_pages == 0:
+                return [], 0
+
+            num_workers = max(
+                1,
+                min(
+                    self.max_processors,
+                    os.cpu_count() or 1,
+                    num_pages // MIN_PAGES_PER_WORKER,
+                ),
+            )
+            page_segments = self.get_page_segments(num_pages, num_workers)
             num_utilized_processors = len(page_segments)
 
             logging.info(f"Processing PDF using {num_utilized_processors} processors")
@@ -93,7 +220,7 @@ class PymupdfParser(BaseParser):
             # Create arguments for each worker
             chunk_args = [
                 (
-                    file,
+                    file_path,
                     start_page,
                     end_page,
                     footer_margin,
@@ -105,30 +232,26 @@ class PymupdfParser(BaseParser):
             ]
 
             # Process pages in parallel
-            loop = asyncio.get_running_loop()
-            tasks = [
-                loop.run_in_executor(executor, self.process_page_chunk, *arg)
-                for arg in chunk_args
-            ]
-            chunk_results = await asyncio.gather(*tasks)
-            results = [result for chunk in chunk_results for result in chunk]
-
-            # Sort results by page number
-            results.sort(key=lambda x: x[0])
-
-            # Convert results to Element objects
-            elements = [
-                Element(
-                    self.extract_bbox_text(doc[page_num], bbox),
-                    content_type,
-                    page_num + 1,
-                    page_num + 1,
-                )
-                for page_num, content in results
-                for bbox, content_type in content
-            ]
+            executor = executor or self.get_executor()
 
-            doc.close()
+            async def run_chunk(args):
+                results = await loop.run_in_executor(
+                    executor, self.process_page_chunk, *args
+                )
+                return to_elements(results)
+
+            # Each chunk is converted as soon as it finishes, while the others
+            # are still running; gather returns them in page order
+            tasks = [asyncio.ensure_future(run_chunk(args)) for args in chunk_args]
+            try:
+                element_chunks = await asyncio.gather(*tasks)
+            finally:
+                # If a chunk failed, don't leave the others running unawaited
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+            elements = [element for chunk in element_chunks for element in chunk]
             return elements, num_pages
 
         except Exception as e:
@@ -137,71 +260,100 @@ class PymupdfParser(BaseParser):
             )
             raise
 
-    def get_page_segments(self, num_pages: int) -> List[Tuple[int, int]]:
+        finally:
+            if spooled_path:
+                os.unlink(spooled_path)
+
+    def get_page_segments(
+        self, num_pages: int, num_workers: Optional[int] = None
+    ) -> List[Tuple[int, int]]:
         """
         Divide pages into segments for parallel processing.
 
         Args:
             num_pages (int): Total number of pages in the document.
+            num_workers (Optional[int]): Number of segments to aim for. Defaults to
+                                         max_processors.
 
         Returns:
             List[Tuple[int, int]]: List of tuples where each tuple defines a start and end page range.
-
-        Raises:
-            ValueError: If max_processors is less than or equal to 0.
         """
-        if self.max_processors <= 0:
-            raise ValueError("Number of processors must be greater than 0")
-
-        chunk_size = num_pages // self.max_processors
-        remainder = num_pages % self.max_processors
+        return list(_page_segments(num_pages, num_workers or self.max_processors))
 
-        chunks = []
-        start_page = 0
+    def _count_pages(self, file_path: str) -> int:
+        """
+        Open a document in this process just long enough to count its pages.
 
-        for i in range(self.max_processors):
-            extra = 1 if i < remainder else 0
-            end_page = start_page + chunk_size + extra
-            end_page = min(end_page, num_pages)
-            chunks.append((start_page, end_page))
-            start_page = end_page
+        Runs on the parser's local thread. Page parsing always happens in the
+        process pool, so the count for one upload never waits behind another
+        upload's parse.
 
-            if start_page >= num_pages:
-                break
+        Args:
+            file_path (str): Path of the PDF file.
 
-        return chunks
+        Returns:
+            int: Number of pages in the document.
+        """
+        doc = fitz.open(file_path, filetype="pdf")
+        try:
+            return len(doc)
+        finally:
+            # Workers open their own copy, so release this one before dispatching
+            doc.close()
 
     def process_page_chunk(
         self,
-        file_bytes: bytes,
+        file_path: str,
         start_page: int,
         end_page: int,
         footer_margin: int,
         header_margin: int,
         no_image_text: bool,
         tolerance: int,
-    ) -> List[Tuple[int, list]]:
+    ) -> List[PageResult]:
         """
         Process a chunk of pages and extract their content.
 
         Args:
-            args (Tuple[bytes, int, int]): Tuple containing file bytes, start page, and end page.
+            file_path (str): Path of the spooled PDF file.
+            start_page (int): First page of the chunk.
+            end_page (int): Page after the last page of the chunk.
 
         Returns:
-            List[Tuple[int, list]]: List of page numbers and their extracted content.
+            List[PageResult]: Extracted texts and content types of each page.
         """
         results = []
-        doc = fitz.open(stream=file_bytes, filetype="pdf")
-
-        for page_num in range(start_page, end_page):
-            page = doc[page_num]
-            page.wrap_contents()
-            content = self.get_ordered_content(
-                page, footer_margin, header_margin, no_image_text, tolerance
-            )
-            results.append((page_num, content))
-
-        doc.close()
+        doc = fitz.open(file_path, filetype="pdf")
+        try:
+            for page_num in range(start_page, end_page):
+                page = doc[page_num]
+                # Wrapping rewrites the content stream and extraction doesn't need it
+                if self.wrap_contents:
+                    page.wrap_contents()
+                # Regions probed while splitting around tables are extracted again
+                # for the final elements, so remember every clip's text per page
+                text_cache = {}
+                content = self.get_ordered_content(
+                    page,
+                    footer_margin,
+                    header_margin,
+                    no_image_text,
+                    tolerance,
+                    text_cache,
+                )
+                # Extract text here so it runs in parallel across workers
+                results.append(
+                    PageResult(
+                        page_num,
+                        [
+                            self.extract_bbox_text(page, bbox, text_cache)
+                            for bbox, _ in content
+                        ],
+                        [content_type for _, content_type in content],
+                    )
+                )
+        finally:
+            doc.close()
 
         return results
 
@@ -212,12 +364,14 @@ class PymupdfParser(BaseParser):
         header_margin: int,
         no_image_text: bool,
         tolerance: int,
+        text_cache: Optional[dict] = None,
     ) -> List:
         """
         Extract and order content from a page, distinguishing between text and tables.
 
         Args:
             page (fitz.Page): The page to extract content from.
+            text_cache (Optional[dict]): Text already extracted from this page.
 
         Returns:
             List: Ordered content as bounding boxes with their associated types (text or table).
@@ -226,19 +380,25 @@ class PymupdfParser(BaseParser):
             page, footer_margin, header_margin, no_image_text
         )
 
+        # find_tables builds its own text page and reads drawings itself, with
+        # small glyph heights switched on, so it can't reuse column_boxes' data
         tables = page.find_tables()
         table_bboxes = [fitz.IRect(table.bbox) for table in tables]
+
+        # Most pages have no tables, and then every column is plain text
+        if not table_bboxes:
+            return [(text_bbox, "text") for text_bbox in text_bboxes]
+
         merged_tables = self.merge_tables(table_bboxes, tolerance)
 
         ordered_content = []
         processed_tables = set()
 
-        for text_bbox in text_bboxes:
-            intersecting_tables = []
+        # Test every text bbox against every table in one vectorised pass
+        overlaps = intersection_mask(bbox_array(text_bboxes), bbox_array(merged_tables))
 
-            for table_bbox in merged_tables:
-                if not (text_bbox & table_bbox).is_empty:
-                    intersecting_tables.append(table_bbox)
+        for text_bbox, overlap in zip(text_bboxes, overlaps):
+            intersecting_tables = [merged_tables[j] for j in np.flatnonzero(overlap)]
 
             if not intersecting_tables:
                 ordered_content.append((text_bbox, "text"))
@@ -247,7 +407,7 @@ class PymupdfParser(BaseParser):
             intersecting_tables.sort(key=lambda x: x.y0)
 
             bbox_above, bbox_below = self.split_bbox_by_table(
-                text_bbox, intersecting_tables[0], page
+                text_bbox, intersecting_tables[0], page, text_cache
             )
 
             if bbox_above:
@@ -267,7 +427,7 @@ class PymupdfParser(BaseParser):
             for table_bbox in intersecting_tables[1:]:
                 if current_bbox:
                     bbox_above, bbox_below = self.split_bbox_by_table(
-                        current_bbox, table_bbox, page
+                        current_bbox, table_bbox, page, text_cache
                     )
                     if bbox_above:
                         ordered_content.append((bbox_above, "text"))
@@ -304,7 +464,6 @@ class PymupdfParser(BaseParser):
         # [Rest of the column_boxes method remains unchanged]
         paths = page.get_drawings()
         bboxes = []
-        path_rects = []
         img_bboxes = []
         vert_bboxes = []
 
@@ -313,25 +472,21 @@ class PymupdfParser(BaseParser):
         clip.y0 += header_margin
 
         def can_extend(temp, bb, bboxlist):
-            for b in bboxlist:
-                if not intersects_bboxes(temp, vert_bboxes) and (
-                    b is None or b == bb or (temp & b).is_empty
-                ):
-                    continue
+            if not bboxlist:
+                return True
+            # The vertical text check doesn't depend on the list entry, so run
+            # it once rather than for every box
+            if intersects_bboxes(temp, vert_bboxes):
                 return False
-            return True
-
-        def in_bbox(bb, bboxes):
-            for i, bbox in enumerate(bboxes):
-                if bb in bbox:
-                    return i + 1
-            return 0
-
-        def intersects_bboxes(bb, bboxes):
-            for bbox in bboxes:
-                if not (bb & bbox).is_empty:
-                    return True
-            return False
+            return all(b is None or b == bb or (temp & b).is_empty for b in bboxlist)
+
+        # Lookups go through y0-sorted indexes so each query only scans the
+        # boxes that start above it.
+        def in_bbox(bb, bbox_index):
+            return bbox_index.first_containing(bb)
+
+        def intersects_bboxes(bb, bbox_index):
+            return bbox_index.intersects(bb)
 
         def extend_right(bboxes, width, path_bboxes, vert_bboxes, img_bboxes):
             for i, bb in enumerate(bboxes):
@@ -344,7 +499,11 @@ class PymupdfParser(BaseParser):
                 temp = +bb
                 temp.x1 = width
 
-                if intersects_bboxes(temp, path_bboxes + vert_bboxes + img_bboxes):
+                if (
+                    intersects_bboxes(temp, path_bboxes)
+                    or intersects_bboxes(temp, vert_bboxes)
+                    or intersects_bboxes(temp, img_bboxes)
+                ):
                     continue
 
                 check = can_extend(temp, bb, bboxes)
@@ -385,13 +544,11 @@ class PymupdfParser(BaseParser):
         # Check if structured extraction is possible
         try:
             # Extract paths and images first
-            for p in paths:
-                path_rects.append(p["rect"].irect)
-            path_bboxes = path_rects
+            path_bboxes = BBoxIndex(p["rect"].irect for p in paths)
 
-            path_bboxes.sort(key=lambda b: (b.y0, b.x0))
             for item in page.get_images():
                 img_bboxes.extend(page.get_image_rects(item[0]))
+            img_bboxes = BBoxIndex(img_bboxes)
 
             # Get the blocks using default dictionary method
             blocks = page.get_text(
@@ -407,25 +564,23 @@ class PymupdfParser(BaseParser):
                 )
                 return [clip]
 
-            # Check if any block has invalid bounding box coordinates
-            has_invalid_blocks = False
-            for b in blocks:
-                bbox_coords = b.get("bbox", (0, 0, 0, 0))
-                # Check for extreme values that indicate invalid bounding boxes
-                if any(coord > 2147483000 for coord in bbox_coords) or any(
-                    coord < -2147483000 for coord in bbox_coords
-                ):
-                    has_invalid_blocks = True
-                    logging.warning(f"Invalid block bbox found: {bbox_coords}")
-                    break
-
-            if has_invalid_blocks:
+            # Check all block bboxes for extreme values, which indicate invalid
+            # bounding boxes, in one vectorised comparison
+            block_coords = np.array(
+                [b.get("bbox", (0, 0, 0, 0)) for b in blocks], dtype=np.float64
+            ).reshape(-1, 4)
+            invalid = np.flatnonzero((np.abs(block_coords) > 2147483000).any(axis=1))
+            if len(invalid):
+                logging.warning(
+                    f"Invalid block bbox found: {blocks[invalid[0]].get('bbox')}"
+                )
                 logging.warning(
                     f"Invalid blocks found on page {page.number}, falling back to simple text extraction"
                 )
                 return [clip]
 
-            # Process valid blocks
+            # Process valid blocks; "blocks" mode would be cheaper to extract
+            # but lacks the line boxes and text direction used here
             for b in blocks:
                 bbox = fitz.IRect(b["bbox"])
 
@@ -449,7 +604,7 @@ class PymupdfParser(BaseParser):
                 for line in b["lines"]:
                     try:
                         lbbox = fitz.IRect(line["bbox"])
-                        text = "".join([s["text"].strip() for s in line["spans"]])
+                        text = "".join(s["text"] for s in line["spans"]).strip()
                         if len(text) > 1:
                             srect |= lbbox
                     except (KeyError, TypeError):
@@ -468,6 +623,7 @@ class PymupdfParser(BaseParser):
                 return [clip]  # Return the entire page as one bbox
 
             # Continue with normal processing for valid bboxes
+            vert_bboxes = BBoxIndex(vert_bboxes)
             bboxes.sort(key=lambda k: (in_bbox(k, path_bboxes), k.y0, k.x0))
             bboxes = extend_right(
                 bboxes, int(page.rect.width), path_bboxes, vert_bboxes, img_bboxes
@@ -501,7 +657,8 @@ class PymupdfParser(BaseParser):
                     j = len(nblocks) - 1
                     temp = nblocks[j]
 
-                check = can_extend(temp, bb, bboxes)
+                # Boxes before i have already been consumed and set to None
+                check = can_extend(temp, bb, bboxes[i:])
                 if not check:
                     nblocks.append(bb)
                 else:
@@ -519,7 +676,7 @@ class PymupdfParser(BaseParser):
             return [clip]
 
     def split_bbox_by_table(
-        self, text_bbox, table_bbox, page
+        self, text_bbox, table_bbox, page, text_cache=None
     ) -> Tuple[Optional[fitz.IRect], Optional[fitz.IRect]]:
         """
         Split a text bounding box by intersecting table bounding boxes.
@@ -528,28 +685,36 @@ class PymupdfParser(BaseParser):
             text_bbox (fitz.IRect): Text bounding box to split.
             table_bbox (fitz.IRect): Table bounding box causing the split.
             page (fitz.Page): The page containing the bounding boxes.
+            text_cache (Optional[dict]): Text already extracted from this page.
 
         Returns:
             Tuple[Optional[fitz.IRect], Optional[fitz.IRect]]: Bounding boxes above and below the table.
         """
+        # Clamp both parts to the text box, so a table that only covers one
+        # edge of it leaves an empty part on the other side
+        potential_bbox_above = fitz.IRect(
+            text_bbox.x0, text_bbox.y0, text_bbox.x1, min(text_bbox.y1, table_bbox.y0)
+        )
+        potential_bbox_below = fitz.IRect(
+            text_bbox.x0, max(text_bbox.y0, table_bbox.y1), text_bbox.x1, text_bbox.y1
+        )
+
         bbox_above = None
         bbox_below = None
 
-        if text_bbox.y0 < table_bbox.y0:
-            potential_bbox_above = fitz.IRect(
-                text_bbox.x0, text_bbox.y0, text_bbox.x1, table_bbox.y0
-            )
-            text_above = page.get_text("text", clip=potential_bbox_above).strip()
-            if text_above:
-                bbox_above = potential_bbox_above
+        if (
+            not potential_bbox_above.is_empty
+            and potential_bbox_above.height >= MIN_SPLIT_HEIGHT
+            and self.extract_bbox_text(page, potential_bbox_above, text_cache)
+        ):
+            bbox_above = potential_bbox_above
 
-        if text_bbox.y1 > table_bbox.y1:
-            potential_bbox_below = fitz.IRect(
-                text_bbox.x0, table_bbox.y1, text_bbox.x1, text_bbox.y1
-            )
-            text_below = page.get_text("text", clip=potential_bbox_below).strip()
-            if text_below:
-                bbox_below = potential_bbox_below
+        if (
+            not potential_bbox_below.is_empty
+            and potential_bbox_below.height >= MIN_SPLIT_HEIGHT
+            and self.extract_bbox_text(page, potential_bbox_below, text_cache)
+        ):
+            bbox_below = potential_bbox_below
 
         return bbox_above, bbox_below
 
@@ -557,6 +722,15 @@ class PymupdfParser(BaseParser):
         """
         Merge overlapping or closely aligned table bounding boxes.
 
+        A single sweep: each table is compared only with the group built up
+        from the tables before it and either joins that group or starts a new
+        one. find_tables already returns tables sorted by (y0, x0), so the
+        sweep takes them in the order given rather than sorting them again.
+
+        merge_mask checks every neighbouring pair in one step. That answer
+        holds while the group is still a single table; once it has grown, the
+        grown box is checked with should_merge_tables instead.
+
         Args:
             table_bboxes (List[fitz.IRect]): List of table bounding boxes to merge.
 
@@ -566,20 +740,30 @@ class PymupdfParser(BaseParser):
         if not table_bboxes:
             return []
 
+        mergeable = merge_mask(bbox_array(table_bboxes), tolerance).tolist()
+
         merged = []
         current_group = table_bboxes[0]
+        grown = False
+
+        for bbox, neighbours_merge in zip(table_bboxes[1:], mergeable):
+            if grown:
+                should_merge = self.should_merge_tables(current_group, bbox, tolerance)
+            else:
+                should_merge = neighbours_merge
 
-        for bbox in table_bboxes[1:]:
-            if self.should_merge_tables(current_group, bbox, tolerance):
+            if should_merge:
                 current_group = fitz.IRect(
                     min(current_group.x0, bbox.x0),
                     min(current_group.y0, bbox.y0),
                     max(current_group.x1, bbox.x1),
                     max(current_group.y1, bbox.y1),
                 )
+                grown = True
             else:
                 merged.append(current_group)
                 current_group = bbox
+                grown = False
 
         merged.append(current_group)
         return merged
@@ -595,31 +779,42 @@ class PymupdfParser(BaseParser):
         Returns:
             bool: True if the bounding boxes should be merged, otherwise False.
         """
-        horizontally_aligned = (
-            abs(bbox1.y0 - bbox2.y0) < tolerance
-            and abs(bbox1.y1 - bbox2.y1) < tolerance
-        )
-        vertically_aligned = (
-            abs(bbox1.x0 - bbox2.x0) < tolerance
-            and abs(bbox1.x1 - bbox2.x1) < tolerance
-        )
-
-        horizontal_distance = min(abs(bbox1.x1 - bbox2.x0), abs(bbox2.x1 - bbox1.x0))
-        vertical_distance = min(abs(bbox1.y1 - bbox2.y0), abs(bbox2.y1 - bbox1.y0))
+        # Same rule as geometry.merge_mask, which merge_tables uses for the
+        # ungrown pairs; read each coordinate once and stop as soon as
+        # alignment fails
+        ax0, ay0, ax1, ay1 = bbox1.x0, bbox1.y0, bbox1.x1, bbox1.y1
+        bx0, by0, bx1, by1 = bbox2.x0, bbox2.y0, bbox2.x1, bbox2.y1
+
+        horizontally_aligned = abs(ay0 - by0) < tolerance and abs(ay1 - by1) < tolerance
+        vertically_aligned = abs(ax0 - bx0) < tolerance and abs(ax1 - bx1) < tolerance
+        if not (horizontally_aligned or vertically_aligned):
+            return False
 
-        is_close = horizontal_distance < tolerance or vertical_distance < tolerance
+        horizontal_distance = min(abs(ax1 - bx0), abs(bx1 - ax0))
+        vertical_distance = min(abs(ay1 - by0), abs(by1 - ay0))
 
-        return (horizontally_aligned or vertically_aligned) and is_close
+        return horizontal_distance < tolerance or vertical_distance < tolerance
 
-    def extract_bbox_text(self, page, bbox):
+    def extract_bbox_text(self, page, bbox, text_cache=None):
         """
         Extract text from a specific bounding box on a page.
 
         Args:
             page (fitz.Page): The page containing the bounding box.
             bbox (fitz.IRect): The bounding box from which to extract text.
+            text_cache (Optional[dict]): Text already extracted from this page,
+                keyed by bbox coordinates. Filled in as new boxes are extracted.
 
         Returns:
             str: Extracted text.
         """
-        return page.get_text("text", clip=bbox).strip()
+        # Each region gets its own clipped extraction on purpose: MuPDF drops
+        # characters outside the clip before forming lines, so the result can't
+        # be rebuilt from a single page-wide words or dict pass
+        if text_cache is None:
+            return page.get_text("text", clip=bbox).strip()
+
+        key = tuple(bbox)
+        if key not in text_cache:
+            text_cache[key] = page.get_text("text", clip=bbox).strip()
+        return text_cache[key]
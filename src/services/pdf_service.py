@@ -1,12 +1,67 @@
 # app/services/pdf_service.py
-from concurrent.futures import ProcessPoolExecutor
-from typing import Optional
+import hashlib
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from typing import AsyncIterator, BinaryIO, List, Optional
 
+import orjson
 from fastapi import UploadFile
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from src.models.data_schemas import ParseConfig
 
+from src.parser_lib.categories import Element
 from src.parser_lib.pdf_parser import PymupdfParser
 
+# Size of the blocks read from the upload while spooling and hashing it; large
+# blocks keep the number of Python-level read/write calls small for big PDFs
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# Number of elements serialized per chunk of the streamed response
+STREAM_BATCH_SIZE = 256
+
+# Rough memory held by one cached element besides its text (the object, its
+# string header and page numbers), used to keep the result cache within budget
+ELEMENT_OVERHEAD_BYTES = 128
+
+
+async def stream_json(elements: List[Element], num_pages: int) -> AsyncIterator[bytes]:
+    """Serialize the parse result as JSON chunk by chunk instead of all at once."""
+    yield b'{"elements":['
+    for start in range(0, len(elements), STREAM_BATCH_SIZE):
+        batch = elements[start : start + STREAM_BATCH_SIZE]
+        chunk = b",".join(
+            orjson.dumps(
+                {
+                    "content": element.text,
+                    "content_type": element.category,
+                    "start_page": element.start_page,
+                    "end_page": element.end_page,
+                }
+            )
+            for element in batch
+        )
+        yield chunk if start == 0 else b"," + chunk
+    yield b'],"num_pages":' + orjson.dumps(num_pages) + b"}"
+
+
+def result_size(elements: List[Element]) -> int:
+    """Approximate the memory held by a list of parsed elements, in bytes."""
+    return sum(len(element.text) for element in elements) + (
+        ELEMENT_OVERHEAD_BYTES * len(elements)
+    )
+
+
+def copy_and_hash(src: BinaryIO, dst: BinaryIO) -> bytes:
+    """Copy a file object to another and return the BLAKE2b digest of its bytes."""
+    digest = hashlib.blake2b()
+    while chunk := src.read(COPY_CHUNK_SIZE):
+        digest.update(chunk)
+        dst.write(chunk)
+    return digest.digest()
+
 
 class PDFParseService:
     """Thin wrapper around PymupdfParser so we construct it only once using a config dict."""
@@ -19,9 +74,9 @@ class PDFParseService:
         header_margin = config.get("header_margin", 10)
         no_image_text = config.get("no_image_text", False)
         tolerance = config.get("tolerance", 20)
-
-        if max_processors <= 0:
-            raise ValueError("Number of processors must be greater than 0")
+        wrap_contents = config.get("wrap_contents", False)
+        cache_max_mb = config.get("cache_max_mb", 0)
+        spool_dir = config.get("spool_dir")
 
         self._parser = PymupdfParser(
             max_processors=max_processors,
@@ -29,25 +84,75 @@ class PDFParseService:
             header_margin=header_margin,
             no_image_text=no_image_text,
             tolerance=tolerance,
+            wrap_contents=wrap_contents,
+            spool_dir=spool_dir,
         )
 
-        self._executor = ProcessPoolExecutor(max_workers=max_processors)
+        # Parse results of recent uploads, keyed by content digest and options,
+        # so retried or repeated documents are not parsed again. Each entry
+        # keeps its approximate size so the total stays within cache_max_mb.
+        self._cache_max_bytes = int(cache_max_mb * 1024 * 1024)
+        self._cache_bytes = 0
+        self._cache = OrderedDict()
 
     async def parse(self, file: UploadFile, parse_config: Optional[ParseConfig]):
-        """Parse the given PDF content and return elements and page count."""
-        content = await file.read()
-        elements, num_pages = await self._parser.parse(
-            content, self._executor, parse_config
+        """Parse the given PDF content and stream back its elements and page count."""
+        file_path = None
+        cache_key = None
+        try:
+            # Stream the upload to disk rather than holding a second copy in memory
+            with tempfile.NamedTemporaryFile(
+                suffix=".pdf", dir=self._parser.spool_dir, delete=False
+            ) as tmp:
+                file_path = tmp.name
+                if self._cache_max_bytes > 0:
+                    digest = await run_in_threadpool(copy_and_hash, file.file, tmp)
+                    cache_key = (digest, parse_config)
+                else:
+                    # With the cache off, the digest would never be looked up
+                    await run_in_threadpool(
+                        shutil.copyfileobj, file.file, tmp, COPY_CHUNK_SIZE
+                    )
+
+            result = self._cache_get(cache_key) if cache_key else None
+            if result is None:
+                result = await self._parser.parse(file_path, parse_config=parse_config)
+                if cache_key:
+                    self._cache_put(cache_key, result)
+        finally:
+            if file_path:
+                os.unlink(file_path)
+
+        elements, num_pages = result
+        return StreamingResponse(
+            stream_json(elements, num_pages), media_type="application/json"
         )
 
-        serializable_elements = [
-            {
-                "content": element.text,
-                "content_type": element.category,
-                "start_page": element.start_page,
-                "end_page": element.end_page,
-            }
-            for element in elements
-        ]
-
-        return {"elements": serializable_elements, "num_pages": num_pages}
+    def _cache_get(self, key):
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        self._cache.move_to_end(key)
+        return entry[0]
+
+    def _cache_put(self, key, result):
+        if self._cache_max_bytes <= 0:
+            return
+        size = result_size(result[0])
+        if size > self._cache_max_bytes:
+            return
+
+        # The same document may have been parsed by a concurrent request
+        previous = self._cache.pop(key, None)
+        if previous is not None:
+            self._cache_bytes -= previous[1]
+
+        self._cache[key] = (result, size)
+        self._cache_bytes += size
+        while self._cache_bytes > self._cache_max_bytes:
+            _, (_, evicted_size) = self._cache.popitem(last=False)
+            self._cache_bytes -= evicted_size
+
+    def shutdown(self):
+        """Stop the worker processes shared by all parse requests."""
+        self._parser.close()
@@ -0,0 +1,104 @@
+import random
+
+import numpy as np
+import pytest
+import fitz
+
+from src.parser_lib.geometry import BBoxIndex, merge_mask
+
+
+def brute_force_first_containing(bb, bboxes):
+    """Reference containment lookup: linear scan over boxes sorted by (y0, x0)."""
+    for i, bbox in enumerate(sorted(bboxes, key=lambda b: (b.y0, b.x0))):
+        if bb in bbox:
+            return i + 1
+    return 0
+
+
+def brute_force_intersects(bb, bboxes):
+    """Reference intersection lookup: linear scan over every box."""
+    return any(not (bb & bbox).is_empty for bbox in bboxes)
+
+
+INDEXED_BBOXES = [
+    fitz.IRect(0, 50, 100, 100),
+    fitz.IRect(0, 0, 100, 100),
+    fitz.IRect(10, 10, 20, 20),
+    fitz.IRect(200, 0, 300, 50),
+    fitz.IRect(40, 40, 40, 60),  # Zero width
+    fitz.IRect(300, 50, 400, 50),  # Zero height
+    fitz.IRect(500, 500, 500, 500),  # Single point
+]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        fitz.IRect(10, 10, 20, 20),  # Identical to an indexed box
+        fitz.IRect(0, 0, 100, 100),  # Shares every edge with its container
+        fitz.IRect(0, 50, 100, 100),  # Contained by two boxes
+        fitz.IRect(100, 0, 200, 50),  # Touches boxes on the left and right
+        fitz.IRect(0, 100, 100, 150),  # Touches a bottom edge
+        fitz.IRect(40, 45, 40, 55),  # Zero width, inside a zero-width box
+        fitz.IRect(300, 50, 350, 50),  # Zero height, on a zero-height box
+        fitz.IRect(500, 500, 500, 500),  # Point on a point
+        fitz.IRect(50, 50, 50, 50),  # Point inside a box
+        fitz.IRect(90, 90, 110, 110),  # Overlaps a corner
+        fitz.IRect(30, 30, 10, 10),  # Invalid
+        fitz.IRect(600, 600, 700, 700),  # Outside every box
+        fitz.Rect(10.5, 10.5, 19.5, 19.5),  # Fractional coordinates
+    ],
+)
+def test_bbox_index_matches_brute_force(query):
+    """Test BBoxIndex lookups against linear scans on edge cases."""
+    index = BBoxIndex(INDEXED_BBOXES)
+
+    assert index.first_containing(query) == brute_force_first_containing(
+        query, INDEXED_BBOXES
+    )
+    assert index.intersects(query) == brute_force_intersects(query, INDEXED_BBOXES)
+
+
+def test_bbox_index_matches_brute_force_random():
+    """Test BBoxIndex lookups against linear scans on random boxes."""
+    rng = random.Random(0)
+
+    def random_irect():
+        x0, y0 = rng.randint(0, 100), rng.randint(0, 100)
+        return fitz.IRect(x0, y0, x0 + rng.randint(0, 30), y0 + rng.randint(0, 30))
+
+    for _ in range(200):
+        bboxes = [random_irect() for _ in range(rng.randint(0, 20))]
+        index = BBoxIndex(bboxes)
+
+        for _ in range(20):
+            query = random_irect()
+            assert index.first_containing(query) == brute_force_first_containing(
+                query, bboxes
+            )
+            assert index.intersects(query) == brute_force_intersects(query, bboxes)
+
+
+def test_bbox_index_caches_containment():
+    """Test that repeated containment lookups are answered from the cache."""
+    index = BBoxIndex(INDEXED_BBOXES)
+    query = fitz.IRect(10, 10, 20, 20)
+
+    position = index.first_containing(query)
+    index._coords = index._coords[:0]
+
+    assert index.first_containing(query) == position
+
+
+def test_merge_mask_int32_distances_do_not_wrap():
+    """Distances between far-apart int32 boxes are not wrapped into range."""
+    int32 = np.iinfo(np.int32)
+    bboxes = np.array(
+        [
+            [int32.min + 1, 0, int32.min + 10, 100],
+            [int32.max - 5, 0, int32.max, 100],
+        ],
+        dtype=np.int32,
+    )
+
+    assert merge_mask(bboxes, 20).tolist() == [False]
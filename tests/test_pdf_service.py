@@ -0,0 +1,174 @@
+import asyncio
+import io
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import yaml
+from fastapi import UploadFile
+
+from src.config.injection import Container
+from src.models.data_schemas import ParseConfig
+from src.parser_lib.categories import CategoryEnum, Element
+from src.services.pdf_service import (
+    STREAM_BATCH_SIZE,
+    PDFParseService,
+    result_size,
+    stream_json,
+)
+
+RESULT = ([Element("x" * 300, "text", 1, 1)], 1)
+RESULT_MB = result_size(RESULT[0]) / (1024 * 1024)
+
+
+@pytest.fixture
+def make_service():
+    """Build a service whose parser returns RESULT without parsing anything."""
+
+    def make(cache_max_mb=0):
+        service = PDFParseService({"cache_max_mb": cache_max_mb})
+        service._parser.parse = AsyncMock(return_value=RESULT)
+        return service
+
+    return make
+
+
+def parse(service, content, parse_config=None):
+    upload = UploadFile(file=io.BytesIO(content), filename="test.pdf")
+    return asyncio.run(service.parse(upload, parse_config))
+
+
+def test_container_passes_parser_settings():
+    """The service is configured with the settings under parser_settings."""
+    with open(Path("src/config/parser_settings.yaml"), "r") as f:
+        parser_settings = yaml.safe_load(f)["parser_settings"]
+
+    assert Container.pdf_parse_service.kwargs["config"] == parser_settings
+
+
+def test_service_reads_parser_settings():
+    """Settings from the config dict reach the parser."""
+    service = PDFParseService(
+        {"max_processors": 3, "tolerance": 5, "wrap_contents": True}
+    )
+
+    assert service._parser.max_processors == 3
+    assert service._parser.tolerance == 5
+    assert service._parser.wrap_contents is True
+
+
+def test_cache_disabled_by_default(make_service):
+    """Without cache_max_mb every upload is parsed."""
+    service = make_service()
+
+    with patch("src.services.pdf_service.copy_and_hash") as mock_copy_and_hash:
+        parse(service, b"a")
+        parse(service, b"a")
+
+    mock_copy_and_hash.assert_not_called()
+    assert service._parser.parse.await_count == 2
+    assert len(service._cache) == 0
+
+
+@pytest.mark.parametrize("cache_max_mb", [0, 1])
+def test_parse_spools_upload(make_service, cache_max_mb):
+    """The parser reads the full upload from the spooled file."""
+    service = make_service(cache_max_mb=cache_max_mb)
+    spooled = []
+
+    async def read_spooled_file(file_path, parse_config=None):
+        with open(file_path, "rb") as f:
+            spooled.append(f.read())
+        return RESULT
+
+    service._parser.parse = AsyncMock(side_effect=read_spooled_file)
+    content = b"%PDF-1.4\n" + bytes(range(256)) * 8192
+
+    parse(service, content)
+
+    assert spooled == [content]
+
+
+def test_cache_hit_and_miss(make_service):
+    """Repeated content is answered from the cache; new content is parsed."""
+    service = make_service(cache_max_mb=1)
+
+    parse(service, b"a")
+    parse(service, b"a")
+    assert service._parser.parse.await_count == 1
+
+    parse(service, b"b")
+    assert service._parser.parse.await_count == 2
+
+
+def test_cache_keyed_by_parse_config(make_service):
+    """The same content with different options is parsed again."""
+    service = make_service(cache_max_mb=1)
+
+    parse(service, b"a")
+    parse(service, b"a", ParseConfig(tolerance=5))
+    parse(service, b"a", ParseConfig(tolerance=5))
+    parse(service, b"a")
+
+    assert service._parser.parse.await_count == 2
+
+
+def test_cache_evicts_least_recently_used_by_size(make_service):
+    """Once the size budget is spent, the least recently used result is dropped."""
+    service = make_service(cache_max_mb=2.5 * RESULT_MB)
+
+    parse(service, b"a")
+    parse(service, b"b")
+    parse(service, b"a")  # Hit; "b" is now the least recently used
+    parse(service, b"c")  # Evicts "b"
+    assert service._parser.parse.await_count == 3
+
+    parse(service, b"a")
+    assert service._parser.parse.await_count == 3
+    parse(service, b"b")
+    assert service._parser.parse.await_count == 4
+    assert service._cache_bytes <= service._cache_max_bytes
+
+
+def test_cache_skips_results_larger_than_budget(make_service):
+    """A result bigger than the whole budget is not cached."""
+    service = make_service(cache_max_mb=0.5 * RESULT_MB)
+
+    parse(service, b"a")
+    parse(service, b"a")
+
+    assert service._parser.parse.await_count == 2
+    assert service._cache_bytes == 0
+
+
+@pytest.mark.parametrize(
+    "num_elements",
+    [0, 1, STREAM_BATCH_SIZE, STREAM_BATCH_SIZE + 1, 2 * STREAM_BATCH_SIZE + 3],
+)
+def test_stream_json_matches_elements(num_elements):
+    """The streamed chunks join into the full JSON document for any batch count."""
+    elements = [
+        Element(
+            f'element "{i}"', CategoryEnum.TABLE if i % 2 else CategoryEnum.TEXT, i, i
+        )
+        for i in range(num_elements)
+    ]
+
+    async def collect():
+        return [chunk async for chunk in stream_json(elements, 7)]
+
+    body = b"".join(asyncio.run(collect()))
+
+    assert json.loads(body) == {
+        "elements": [
+            {
+                "content": element.text,
+                "content_type": str(element.category),
+                "start_page": element.start_page,
+                "end_page": element.end_page,
+            }
+            for element in elements
+        ],
+        "num_pages": 7,
+    }
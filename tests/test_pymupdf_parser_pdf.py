@@ -1,11 +1,15 @@
 import asyncio
-from concurrent.futures import ProcessPoolExecutor
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import pytest
 from unittest.mock import MagicMock, patch, ANY
 import fitz
 
-from src.parser_lib.pdf_parser import PymupdfParser
+from src.parser_lib.geometry import BBox
+from src.parser_lib.pdf_parser import PageResult, PymupdfParser
 
 
 @pytest.fixture
@@ -68,9 +72,8 @@ def test_process_page_chunk(mock_fitz_open, default_parser):
     mock_page.wrap_contents = MagicMock()
     default_parser.get_ordered_content = MagicMock(return_value=[(("bbox"), "text")])
 
-    file_bytes = b"dummy"
     results = default_parser.process_page_chunk(
-        file_bytes,
+        "dummy.pdf",
         0,
         3,
         default_parser.footer_margin,
@@ -100,17 +103,37 @@ def test_process_page_chunk(mock_fitz_open, default_parser):
             ],
             2,
         ),
+        (
+            [
+                {"x0": 0, "y0": 0, "x1": 50, "y1": 10},
+                {"x0": 50, "y0": 0, "x1": 100, "y1": 10},
+                {"x0": 0, "y0": 15, "x1": 100, "y1": 30},
+            ],
+            1,
+        ),  # Last box only lines up with the first two once they are merged
     ],
 )
 def test_merge_tables(default_parser, bboxes, expected_len):
     """Test merging of table bounding boxes."""
-    # Mock the bounding boxes
-    bboxes_mock = [MagicMock(**bbox) for bbox in bboxes]
+    table_bboxes = [BBox(**bbox) for bbox in bboxes]
 
-    merged_tables = default_parser.merge_tables(bboxes_mock, default_parser.tolerance)
+    merged_tables = default_parser.merge_tables(table_bboxes, default_parser.tolerance)
     assert len(merged_tables) == expected_len
 
 
+@pytest.mark.parametrize(
+    "table_bboxes",
+    [
+        [BBox(0, 0, 5, 10), BBox(0, 100, 300, 200), BBox(0, 500, 5, 510)],
+        [BBox(0, 0, 100, 10), BBox(0, 50, 500, 100), BBox(400, 0, 500, 10)],
+    ],
+)
+def test_merge_tables_only_merges_neighbours(default_parser, table_bboxes):
+    """Tables that only line up with a non-adjacent table stay separate."""
+    merged_tables = default_parser.merge_tables(table_bboxes, default_parser.tolerance)
+    assert merged_tables == table_bboxes
+
+
 @pytest.fixture
 def sample_pdf_bytes():
     return (
@@ -154,11 +177,8 @@ def test_parse_with_sample_pdf(sample_pdf_bytes):
 )
 def test_should_merge_tables(default_parser, bbox1, bbox2, expected_result):
     """Test the logic to decide if two tables should merge."""
-    bbox1_mock = MagicMock(**bbox1)
-    bbox2_mock = MagicMock(**bbox2)
-
     result = default_parser.should_merge_tables(
-        bbox1_mock, bbox2_mock, default_parser.tolerance
+        BBox(**bbox1), BBox(**bbox2), default_parser.tolerance
     )
     assert result is expected_result
 
@@ -175,8 +195,8 @@ def test_extract_bbox_text(mock_page, default_parser):
 def test_split_bbox_by_table(default_parser):
     """Test splitting a text bounding box by table bounding boxes."""
     page = MagicMock()
-    bbox = MagicMock(x0=0, y0=0, x1=10, y1=20)
-    table_bbox = MagicMock(x0=0, y0=10, x1=10, y1=15)
+    bbox = BBox(x0=0, y0=0, x1=10, y1=20)
+    table_bbox = BBox(x0=0, y0=10, x1=10, y1=15)
 
     page.get_text.side_effect = ["text above", "text below"]
     bbox_above, bbox_below = default_parser.split_bbox_by_table(bbox, table_bbox, page)
@@ -184,6 +204,31 @@ def test_split_bbox_by_table(default_parser):
     assert bbox_below is not None
 
 
+def test_split_bbox_by_table_skips_thin_regions(default_parser):
+    """Test that regions too thin to hold text are not extracted."""
+    page = MagicMock()
+    bbox = BBox(x0=0, y0=0, x1=10, y1=20)
+    table_bbox = BBox(x0=0, y0=2, x1=10, y1=18)
+
+    bbox_above, bbox_below = default_parser.split_bbox_by_table(bbox, table_bbox, page)
+    assert bbox_above is None
+    assert bbox_below is None
+    page.get_text.assert_not_called()
+
+
+def test_split_bbox_by_table_clamps_to_text_bbox(default_parser):
+    """Test that split regions never extend past the text bounding box."""
+    page = MagicMock()
+    bbox = BBox(x0=0, y0=0, x1=10, y1=20)
+    table_bbox = BBox(x0=0, y0=30, x1=10, y1=40)
+
+    page.get_text.return_value = "text above"
+    bbox_above, bbox_below = default_parser.split_bbox_by_table(bbox, table_bbox, page)
+    assert bbox_above == fitz.IRect(0, 0, 10, 20)
+    assert bbox_below is None
+    page.get_text.assert_called_once()
+
+
 def test_get_page_segments_edge_case(default_parser):
     """Test page segmentation with fewer pages than processors."""
     num_pages = 2
@@ -208,6 +253,157 @@ def test_parse_small_pdf(default_parser):
             assert result is not None
 
 
+def test_parse_small_pdf_runs_as_one_chunk(default_parser):
+    """Documents below the per-worker threshold go to the pool as a single chunk."""
+    mock_doc = MagicMock()
+    mock_doc.__len__.return_value = 2
+    default_parser.get_ordered_content = MagicMock(side_effect=[[("bbox", "text")], []])
+    default_parser.extract_bbox_text = MagicMock(return_value="sample text")
+
+    with patch("fitz.open", return_value=mock_doc):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with patch.object(executor, "submit", wraps=executor.submit) as submit:
+                elements, num_pages = asyncio.run(
+                    default_parser.parse(b"%PDF-1.4\n", executor)
+                )
+
+    submit.assert_called_once_with(
+        default_parser.process_page_chunk, ANY, 0, 2, 0, 0, False, 20
+    )
+    assert default_parser.get_ordered_content.call_count == 2
+    assert mock_doc.close.call_count == 2  # Page count, then the chunk
+    assert num_pages == 2
+    assert [element.text for element in elements] == ["sample text"]
+
+
+def test_parse_counts_pages_on_local_thread(default_parser):
+    """The local thread only counts pages; parsing stays in the pool."""
+    mock_doc = MagicMock()
+    mock_doc.__len__.return_value = 2
+    count_threads = []
+    parse_threads = []
+    count_pages = default_parser._count_pages
+
+    def record_count_thread(file_path):
+        count_threads.append(threading.current_thread().name)
+        return count_pages(file_path)
+
+    def record_parse_thread(*args):
+        parse_threads.append(threading.current_thread().name)
+        return []
+
+    default_parser._count_pages = record_count_thread
+    default_parser.get_ordered_content = record_parse_thread
+
+    with patch("fitz.open", return_value=mock_doc):
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="pool") as executor:
+            asyncio.run(default_parser.parse(b"%PDF-1.4\n", executor))
+    default_parser.close()
+
+    assert len(count_threads) == 1 and count_threads[0].startswith("pymupdf")
+    assert len(parse_threads) == 2
+    assert all(name.startswith("pool") for name in parse_threads)
+
+
+def test_parse_keeps_page_order_when_chunks_finish_out_of_order():
+    """Elements come back in page order whichever chunk finishes first."""
+    parser = PymupdfParser(4, 0, 0, False, 20)
+    mock_doc = MagicMock()
+    mock_doc.__len__.return_value = 16
+    finished = []
+    done = {start_page: threading.Event() for start_page in (0, 4, 8, 12)}
+
+    def process_page_chunk(file_path, start_page, end_page, *args):
+        # Each chunk waits for the one after it, so later chunks finish first
+        if end_page in done:
+            done[end_page].wait(5)
+        finished.append(start_page)
+        done[start_page].set()
+        return [
+            PageResult(page_num, [f"page {page_num}"], ["text"])
+            for page_num in range(start_page, end_page)
+        ]
+
+    parser.process_page_chunk = process_page_chunk
+
+    with patch("fitz.open", return_value=mock_doc), patch(
+        "os.cpu_count", return_value=4
+    ):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            elements, num_pages = asyncio.run(parser.parse(b"%PDF-1.4\n", executor))
+    parser.close()
+
+    assert finished == [12, 8, 4, 0]
+    assert num_pages == 16
+    assert [element.text for element in elements] == [f"page {i}" for i in range(16)]
+    assert [element.start_page for element in elements] == list(range(1, 17))
+
+
+def test_parse_chunk_failure_leaves_no_pending_tasks():
+    """When one chunk fails, the others are cancelled before parse raises."""
+    parser = PymupdfParser(4, 0, 0, False, 20)
+    mock_doc = MagicMock()
+    mock_doc.__len__.return_value = 16
+    release = threading.Event()
+
+    def process_page_chunk(file_path, start_page, end_page, *args):
+        if start_page == 0:
+            raise RuntimeError("Chunk failed")
+        release.wait(5)
+        return []
+
+    parser.process_page_chunk = process_page_chunk
+
+    async def parse_and_collect_pending(executor):
+        with pytest.raises(RuntimeError, match="Chunk failed"):
+            await parser.parse(b"%PDF-1.4\n", executor)
+        return [
+            task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+        ]
+
+    with patch("fitz.open", return_value=mock_doc), patch(
+        "os.cpu_count", return_value=4
+    ):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            try:
+                pending = asyncio.run(parse_and_collect_pending(executor))
+            finally:
+                release.set()
+    parser.close()
+
+    assert pending == []
+
+
+def test_parse_empty_pdf(default_parser):
+    """Documents without pages are not sent to the pool."""
+    mock_doc = MagicMock()
+    mock_doc.__len__.return_value = 0
+    executor = MagicMock()
+
+    with patch("fitz.open", return_value=mock_doc):
+        result = asyncio.run(default_parser.parse(b"%PDF-1.4\n", executor))
+
+    executor.submit.assert_not_called()
+    mock_doc.close.assert_called_once()
+    assert result == ([], 0)
+
+
+def test_parser_owns_reusable_executor(default_parser):
+    """The parser's pool is created once, left out of pickles and closed on demand."""
+    executor = default_parser.get_executor()
+    assert default_parser.get_executor() is executor
+    default_parser._get_local_executor()
+
+    restored = pickle.loads(pickle.dumps(default_parser))
+    assert restored._executor is None
+    assert restored._local_executor is None
+    assert restored.tolerance == default_parser.tolerance
+
+    default_parser.close()
+    assert default_parser._executor is None
+    assert default_parser._local_executor is None
+
+
 def test_parse_corrupted_pdf(default_parser):
     corrupted_pdf_bytes = b"%PDF-1.4\ncorrupted content"
     with patch("fitz.open", side_effect=RuntimeError("Corrupted PDF")):
@@ -313,8 +509,8 @@ def test_column_boxes_no_valid_blocks(default_parser):
 
 def test_split_bbox_by_table_no_intersection(default_parser):
     page = MagicMock()
-    bbox = MagicMock(x0=0, y0=0, x1=10, y1=10)
-    table_bbox = MagicMock(x0=0, y0=20, x1=10, y1=30)  # No vertical overlap
+    bbox = BBox(x0=0, y0=0, x1=10, y1=10)
+    table_bbox = BBox(x0=0, y0=20, x1=10, y1=30)  # No vertical overlap
     page.get_text.return_value = ""
     bbox_above, bbox_below = default_parser.split_bbox_by_table(bbox, table_bbox, page)
     assert bbox_above is None
@@ -322,7 +518,7 @@ def test_split_bbox_by_table_no_intersection(default_parser):
 
 
 @patch("fitz.open")
-def test_parse_cleanup_on_exception(mock_fitz_open):
+def test_parse_cleanup_on_exception(mock_fitz_open, tmp_path):
     """Test file cleanup in finally block when exception occurs."""
     mock_fitz_open.side_effect = Exception("Test exception")
 
@@ -332,10 +528,18 @@ def test_parse_cleanup_on_exception(mock_fitz_open):
         header_margin=10,
         no_image_text=False,
         tolerance=20,
+        spool_dir=str(tmp_path),
     )
 
-    with pytest.raises(Exception):
-        parser.parse(b"%PDF-1.4\n")
+    with patch("os.unlink", wraps=os.unlink) as mock_unlink:
+        with pytest.raises(Exception, match="Test exception"):
+            asyncio.run(parser.parse(b"%PDF-1.4\n", MagicMock()))
+
+    # The bytes were spooled to a file for the workers, which must be removed
+    mock_unlink.assert_called_once()
+    spooled_path = mock_unlink.call_args.args[0]
+    assert os.path.dirname(spooled_path) == str(tmp_path)
+    assert not os.path.exists(spooled_path)
 
 
 def test_column_boxes_with_invalid_block_data(default_parser):
@@ -377,7 +581,7 @@ def test_process_page_chunk_exception(mock_fitz_open, default_parser):
 
     with pytest.raises(Exception):
         default_parser.process_page_chunk(
-            b"dummy",
+            "dummy.pdf",
             0,
             3,
             default_parser.footer_margin,
@@ -395,7 +599,7 @@ def test_merge_tables_empty_input(default_parser):
 
 def test_merge_tables_single_input(default_parser):
     """Test merge_tables with single table bbox."""
-    bbox = MagicMock(x0=0, y0=0, x1=10, y1=10)
+    bbox = BBox(x0=0, y0=0, x1=10, y1=10)
     result = default_parser.merge_tables([bbox], default_parser.tolerance)
     assert len(result) == 1
     assert result[0] == bbox